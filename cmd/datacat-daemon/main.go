@@ -201,7 +201,8 @@ func (d *Daemon) Start() error {
 
 	// Create HTTP server instance for graceful shutdown
 	d.httpServer = &http.Server{
-		Addr: addr,
+		Addr:    addr,
+		Handler: gzipMiddleware(http.DefaultServeMux),
 	}
 
 	// Start shutdown monitor
@@ -210,6 +211,23 @@ func (d *Daemon) Start() error {
 	return d.httpServer.ListenAndServe()
 }
 
+// gzipMiddleware automatically decompresses gzip-encoded requests
+func gzipMiddleware(next http.Handler) http.Handler {
+	return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Header.Get("Content-Encoding") == "gzip" {
+			gzipReader, err := gzip.NewReader(r.Body)
+			if err != nil {
+				http.Error(w, "Failed to decompress request", http.StatusBadRequest)
+				return
+			}
+			defer gzipReader.Close()
+			r.Body = io.NopCloser(gzipReader)
+			r.Header.Del("Content-Encoding")
+		}
+		next.ServeHTTP(w, r)
+	})
+}
+
 // postToServer sends a POST request to the server with compression and authentication
 func (d *Daemon) postToServer(endpoint string, data []byte) (*http.Response, error) {
 	var body io.Reader = bytes.NewBuffer(data)
@@ -466,6 +466,29 @@ class GameSimulator(object):
                   (self.player_name, elapsed, self.frame_count))
 
 
+def run(player_name, mode='normal', duration=None, use_async=True):
+    """
+    Run a single game instance in the current process.
+
+    Importable entry point so launchers (e.g. run_game_swarm.py) can fork
+    game instances without spawning a fresh interpreter per instance.
+
+    Args:
+        player_name (str): Player name/identifier
+        mode (str): Game mode ('normal', 'hang', 'crash')
+        duration (int): How long to run in seconds (None = infinite)
+        use_async (bool): Use async (non-blocking) logging
+    """
+    game = GameSimulator(
+        player_name=player_name,
+        mode=mode,
+        duration=duration,
+        use_async=use_async
+    )
+
+    game.run()
+
+
 def main():
     parser = argparse.ArgumentParser(description='Example game with DataCat logging')
     parser.add_argument(
@@ -507,14 +530,7 @@ def main():
     print("Press Ctrl+C to stop")
     print()
 
-    game = GameSimulator(
-        player_name=args.player,
-        mode=args.mode,
-        duration=args.duration,
-        use_async=not args.no_async
-    )
-
-    game.run()
+    run(args.player, args.mode, args.duration, use_async=not args.no_async)
 
 
 if __name__ == '__main__':
@@ -9,6 +9,7 @@ using a custom handler that formats and sends log messages and exceptions.
 from __future__ import print_function
 import sys
 import os
+import linecache
 import logging
 import traceback
 import time
@@ -68,12 +69,20 @@ class DatacatLoggingHandler(logging.Handler):
                 "timestamp": datetime.fromtimestamp(record.created).isoformat(),
             }
 
-            # If there's exception info, include formatted traceback
+            # If there's exception info, include formatted traceback.
+            # Capture the frames without reading source lines up front
+            # (lookup_lines=False); lines are resolved lazily from the
+            # pre-warmed linecache when format() runs, so sibling exceptions
+            # from the same call sites reuse the cached source instead of
+            # re-reading files on every emit.
             if record.exc_info:
+                tb_exc = traceback.TracebackException(
+                    *record.exc_info, lookup_lines=False
+                )
                 event_data["exception"] = {
                     "type": record.exc_info[0].__name__,
                     "message": str(record.exc_info[1]),
-                    "traceback": traceback.format_exception(*record.exc_info),
+                    "traceback": list(tb_exc.format()),
                 }
 
             # Add any extra fields from the record
@@ -129,6 +138,15 @@ def setup_logging(session, level=logging.INFO):
     logger = logging.getLogger("myapp")
     logger.setLevel(level)
 
+    # Pre-warm linecache for the application's own modules so that the first
+    # exception formatted by the handler doesn't pay the source-file reads.
+    linecache.checkcache()
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    for mod in list(sys.modules.values()):
+        mod_file = getattr(mod, "__file__", None)
+        if mod_file and mod_file.endswith(".py") and mod_file.startswith(app_dir):
+            linecache.getlines(mod_file)
+
     # Remove any existing handlers
     logger.handlers = []
 
@@ -18,18 +18,40 @@ Usage:
 """
 
 from __future__ import print_function
+import array
+import asyncio
+import multiprocessing
+import re
 import sys
 import os
-import subprocess
 import time
 import random
 import argparse
 import signal
 
+# Case-insensitive crash/hang scan over raw bytes - avoids allocating a
+# lowercased copy of every output line just to substring-search it
+_STATUS_PAT = re.compile(rb'(?i)crash|hang')
+
 # Track spawned processes
 processes = []
 
 
+def _has_exited(proc):
+    """True once a process (asyncio or multiprocessing) has been reaped"""
+    if getattr(proc, 'returncode', None) is not None:
+        return True
+    if getattr(proc, 'exitcode', None) is not None:
+        return True
+    # The event loop can't reap for us while we block in a signal handler,
+    # so check directly. WNOHANG returns (0, 0) while the child still runs.
+    try:
+        pid, _ = os.waitpid(proc.pid, os.WNOHANG)
+        return pid != 0
+    except (OSError, AttributeError):
+        return True
+
+
 def signal_handler(sig, frame):
     """Handle Ctrl+C gracefully"""
     print("\n\nShutting down all game instances...")
@@ -39,11 +61,20 @@ def signal_handler(sig, frame):
         except Exception:
             pass
 
-    # Wait a bit for graceful shutdown
-    time.sleep(2)
+    # Poll for exits with exponential backoff up to a 2s deadline instead
+    # of sleeping a flat 2s - typical shutdown finishes in tens of ms
+    deadline = time.time() + 2.0
+    delay = 0.01
+    remaining = list(processes)
+    while remaining and time.time() < deadline:
+        remaining = [p for p in remaining if not _has_exited(p)]
+        if not remaining:
+            break
+        time.sleep(delay)
+        delay = min(delay * 2, 0.1)
 
     # Force kill any remaining
-    for proc in processes:
+    for proc in remaining:
         try:
             proc.kill()
         except Exception:
@@ -53,7 +84,7 @@ def signal_handler(sig, frame):
     sys.exit(0)
 
 
-def launch_game(player_name, mode, duration, no_async=False):
+async def launch_game(player_name, mode, duration, no_async=False):
     """
     Launch a single game instance
 
@@ -64,7 +95,7 @@ def launch_game(player_name, mode, duration, no_async=False):
         no_async (bool): Disable async logging
 
     Returns:
-        subprocess.Popen: The spawned process
+        asyncio.subprocess.Process: The spawned process
     """
     python_exe = sys.executable
     script_path = os.path.join(os.path.dirname(__file__), 'example_game.py')
@@ -81,16 +112,237 @@ def launch_game(player_name, mode, duration, no_async=False):
         cmd.append('--no-async')
 
     # Launch process
-    proc = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        universal_newlines=True
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT
     )
 
     return proc
 
 
+def launch_game_forked(player_name, mode, duration, no_async=False):
+    """
+    Launch a single game instance by forking the current interpreter.
+
+    Forked children share the already-imported interpreter state
+    (datacat, example_game, stdlib) copy-on-write, avoiding the
+    per-instance interpreter startup and import cost of a fresh
+    subprocess. Linux/macOS only (requires the 'fork' start method).
+
+    Args:
+        player_name (str): Player identifier
+        mode (str): Game mode ('normal', 'hang', 'crash')
+        duration (int): How long to run (seconds)
+        no_async (bool): Disable async logging
+
+    Returns:
+        multiprocessing.Process: The forked process
+    """
+    import example_game
+
+    ctx = multiprocessing.get_context('fork')
+    proc = ctx.Process(
+        target=example_game.run,
+        args=(player_name, mode, duration),
+        kwargs={'use_async': not no_async},
+    )
+    proc.start()
+    return proc
+
+
+async def watch_game_forked(proc, counters, total, start_time):
+    """
+    Wait for a forked game instance to exit and report its outcome.
+
+    Forked instances share our stdout, so status is derived from the
+    exit code rather than scanning output: crash mode exits non-zero,
+    hangs are handled by the timeout path in run_swarm.
+    """
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(None, proc.join)
+
+    if proc.exitcode not in (0, None):
+        status = "CRASHED"
+    else:
+        status = "COMPLETED"
+
+    counters['completed'] += 1
+    elapsed = time.time() - start_time
+    print("[%.1fs] Instance completed (%d/%d) - Status: %s" %
+          (elapsed, counters['completed'], total, status))
+
+
+def _still_running(proc):
+    """True if a process (asyncio or multiprocessing) has not exited yet"""
+    if hasattr(proc, 'returncode'):
+        return proc.returncode is None
+    return proc.is_alive()
+
+
+async def watch_game(proc, counters, total, start_time):
+    """
+    Wait for a single game instance to exit and report its outcome.
+
+    Blocks on the process (no polling); reports completion the moment the
+    process exits.
+
+    Args:
+        proc (asyncio.subprocess.Process): Process to watch
+        counters (dict): Shared 'completed' counter
+        total (int): Total number of instances
+        start_time (float): Swarm start timestamp
+    """
+    status = "COMPLETED"
+    try:
+        # Scan output line-by-line as it is produced rather than buffering
+        # the full run output in the pipe. This keeps memory bounded and
+        # stops the child from blocking on a full pipe buffer (which would
+        # look like a hang).
+        async for line in proc.stdout:
+            match = _STATUS_PAT.search(line)
+            if match is None:
+                continue
+            if match.group(0).lower() == b'crash':
+                status = "CRASHED"
+            elif status == "COMPLETED":
+                status = "HUNG"
+        await proc.wait()
+    except Exception:
+        status = "UNKNOWN"
+
+    counters['completed'] += 1
+    elapsed = time.time() - start_time
+    print("[%.1fs] Instance completed (%d/%d) - Status: %s" %
+          (elapsed, counters['completed'], total, status))
+
+
+async def run_swarm(args):
+    """Launch all instances and wait for them (event-driven, no poll loop)"""
+    # Calculate how many of each type
+    num_hang = int(args.count * args.hang_rate)
+    num_crash = int(args.count * args.crash_rate)
+    num_normal = args.count - num_hang - num_crash
+
+    print("Expected outcomes:")
+    print("  Normal exits: %d" % num_normal)
+    print("  Hangs: %d" % num_hang)
+    print("  Crashes: %d" % num_crash)
+    print()
+    print("Launching instances...")
+    print("Press Ctrl+C to stop all instances")
+    print()
+
+    # Warm the bytecode cache once so every subprocess interpreter loads
+    # example_game.py via a fast marshal read instead of re-parsing it
+    # (also avoids N children racing to write the same __pycache__ entry)
+    if not args.in_process:
+        import py_compile
+        script_path = os.path.join(os.path.dirname(__file__), 'example_game.py')
+        try:
+            py_compile.compile(script_path, doraise=True)
+        except py_compile.PyCompileError:
+            pass  # Let the children report the syntax error themselves
+
+    # Shuffle mode assignments as a byte array of codes rather than a list
+    # of strings - same Fisher-Yates shuffle, but 1 byte per instance
+    # instead of an 8-byte pointer per instance for large swarms
+    mode_names = ('normal', 'hang', 'crash')
+    mode_codes = array.array(
+        'b', [0] * num_normal + [1] * num_hang + [2] * num_crash
+    )
+    random.shuffle(mode_codes)
+
+    counters = {'completed': 0}
+    start_time = time.time()
+    watchers = []
+
+    # Pin instances round-robin across available CPUs so a burst of
+    # simultaneous launches doesn't pile onto the parent's core and pay
+    # migration/cache-miss penalties (Linux only; no-op elsewhere)
+    try:
+        cpus = sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = []
+
+    # Launch instances
+    for i in range(args.count):
+        player_name = "Player_%03d" % (i + 1)
+        mode = mode_names[mode_codes[i]]
+
+        # Add some randomness to duration (±10%)
+        duration = args.duration + random.randint(-args.duration // 10, args.duration // 10)
+
+        print("[%02d/%02d] Launching %s (mode=%s, duration=%ds)..." %
+              (i + 1, args.count, player_name, mode, duration))
+
+        if args.in_process:
+            proc = launch_game_forked(player_name, mode, duration, args.no_async)
+            watcher = watch_game_forked(proc, counters, args.count, start_time)
+        else:
+            proc = await launch_game(player_name, mode, duration, args.no_async)
+            watcher = watch_game(proc, counters, args.count, start_time)
+        processes.append(proc)
+        watchers.append(asyncio.ensure_future(watcher))
+
+        if cpus:
+            try:
+                os.sched_setaffinity(proc.pid, {cpus[i % len(cpus)]})
+            except OSError:
+                pass  # Child may already have exited
+
+        # Stagger launches
+        if i < args.count - 1:
+            await asyncio.sleep(args.stagger)
+
+    print()
+    print("All instances launched!")
+    print()
+    print("=" * 70)
+    print("Monitoring (this may take a while)...")
+    print("=" * 70)
+    print()
+
+    # Wait for all watchers; timeout at duration + 50% buffer
+    timeout = args.duration * 1.5
+    done, pending = await asyncio.wait(watchers, timeout=timeout)
+
+    hung = 0
+    if pending:
+        elapsed = time.time() - start_time
+        # Collect the per-instance lines and emit them in one write: the
+        # timeout branch reports a burst of instances at once, and one
+        # buffered write beats a write() syscall per print
+        status_lines = [
+            "",
+            "Timeout reached (%.1fs). Terminating remaining processes..." % elapsed,
+        ]
+        for proc in processes:
+            if _still_running(proc):
+                hung += 1
+                status_lines.append(
+                    "[%.1fs] Instance timed out (%d/%d) - Status: HUNG (forced)" %
+                    (elapsed, counters['completed'] + hung, args.count))
+                try:
+                    proc.terminate()
+                except Exception:
+                    pass
+        sys.stdout.write("\n".join(status_lines) + "\n")
+        sys.stdout.flush()
+        for task in pending:
+            task.cancel()
+        # Give terminated processes a moment to exit, then force kill
+        await asyncio.sleep(2)
+        for proc in processes:
+            if _still_running(proc):
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
+
+    return counters['completed'], hung, start_time
+
+
 def main():
     parser = argparse.ArgumentParser(description='Launch multiple game instances')
     parser.add_argument(
@@ -128,9 +380,20 @@ def main():
         action='store_true',
         help='Disable async logging for all instances'
     )
+    parser.add_argument(
+        '--in-process',
+        action='store_true',
+        help='Fork game instances from this interpreter instead of spawning '
+             'subprocesses (faster startup; Linux/macOS only)'
+    )
 
     args = parser.parse_args()
 
+    if args.in_process and sys.platform == 'win32':
+        print("ERROR: --in-process requires the 'fork' start method "
+              "(not available on Windows)")
+        sys.exit(1)
+
     # Validate rates
     if args.hang_rate + args.crash_rate > 1.0:
         print("ERROR: hang-rate + crash-rate cannot exceed 1.0")
@@ -153,115 +416,7 @@ def main():
     print("  Async logging: %s" % (not args.no_async))
     print()
 
-    # Calculate how many of each type
-    num_hang = int(args.count * args.hang_rate)
-    num_crash = int(args.count * args.crash_rate)
-    num_normal = args.count - num_hang - num_crash
-
-    print("Expected outcomes:")
-    print("  Normal exits: %d" % num_normal)
-    print("  Hangs: %d" % num_hang)
-    print("  Crashes: %d" % num_crash)
-    print()
-    print("Launching instances...")
-    print("Press Ctrl+C to stop all instances")
-    print()
-
-    # Create list of modes
-    modes = (
-        ['normal'] * num_normal +
-        ['hang'] * num_hang +
-        ['crash'] * num_crash
-    )
-    random.shuffle(modes)
-
-    # Launch instances
-    for i in range(args.count):
-        player_name = "Player_%03d" % (i + 1)
-        mode = modes[i]
-
-        # Add some randomness to duration (±10%)
-        duration = args.duration + random.randint(-args.duration // 10, args.duration // 10)
-
-        print("[%02d/%02d] Launching %s (mode=%s, duration=%ds)..." %
-              (i + 1, args.count, player_name, mode, duration))
-
-        proc = launch_game(player_name, mode, duration, args.no_async)
-        processes.append(proc)
-
-        # Stagger launches
-        if i < args.count - 1:
-            time.sleep(args.stagger)
-
-    print()
-    print("All instances launched!")
-    print()
-    print("=" * 70)
-    print("Monitoring (this may take a while)...")
-    print("=" * 70)
-    print()
-
-    # Monitor processes
-    completed = 0
-    hung = 0
-    start_time = time.time()
-
-    # Set timeout to duration + 50% buffer
-    timeout = args.duration * 1.5
-
-    while completed < args.count:
-        elapsed = time.time() - start_time
-
-        # Check if we've exceeded timeout
-        if elapsed > timeout:
-            print()
-            print("Timeout reached (%.1fs). Terminating remaining processes..." % elapsed)
-            for proc in processes:
-                if proc.poll() is None:  # Still running
-                    if not hasattr(proc, '_reported'):
-                        hung += 1
-                        proc._reported = True
-                        print("[%.1fs] Instance timed out (%d/%d) - Status: HUNG (forced)" %
-                              (elapsed, completed + hung, args.count))
-                    try:
-                        proc.terminate()
-                    except Exception:
-                        pass
-
-            # Wait a bit for graceful termination
-            time.sleep(2)
-
-            # Force kill any that didn't terminate
-            for proc in processes:
-                if proc.poll() is None:
-                    try:
-                        proc.kill()
-                    except Exception:
-                        pass
-            break
-
-        time.sleep(1)
-
-        # Check for completed processes
-        for proc in processes:
-            if proc.poll() is not None and not hasattr(proc, '_reported'):
-                completed += 1
-                proc._reported = True
-
-                # Read output
-                try:
-                    output = proc.stdout.read()
-                    if 'crash' in output.lower():
-                        status = "CRASHED"
-                    elif 'hang' in output.lower():
-                        status = "HUNG"
-                    else:
-                        status = "COMPLETED"
-                except Exception:
-                    status = "UNKNOWN"
-
-                print("[%.1fs] Instance completed (%d/%d) - Status: %s" %
-                      (elapsed, completed, args.count, status))
+    completed, hung, start_time = asyncio.run(run_swarm(args))
 
     print()
     print("=" * 70)
@@ -274,32 +429,38 @@ def main():
         print("  Hung (forced termination): %d" % hung)
     print("  Total time: %.1f seconds" % (time.time() - start_time))
 
-    # Cleanup daemon configs
+    # Cleanup daemon configs. The directory is a known-flat set of config
+    # files, so unlink straight off the scandir entries instead of paying
+    # shutil.rmtree's per-entry lstat tree walk.
     print()
     print("Cleaning up daemon configs...")
-    import shutil
     config_dir = os.path.join("tmp", "daemon_configs")
     if os.path.exists(config_dir):
         try:
-            shutil.rmtree(config_dir)
+            with os.scandir(config_dir) as entries:
+                for entry in entries:
+                    os.unlink(entry.path)
+            os.rmdir(config_dir)
             print("[OK] Cleaned up daemon configs")
         except Exception as e:
             print("Warning: Could not clean up daemon configs: %s" % str(e))
 
-    print()
-    print("Check the DataCat web UI at http://localhost:8080 to see:")
-    print("  - All %d sessions" % args.count)
-    print("  - Crash detection for crashed instances")
-    print("  - Hang detection for hung instances")
-    print("  - Live metrics demonstrating all types:")
-    print("    * Gauges: fps, memory_mb, player_health, player_score")
-    print("    * Counters: frames_rendered, enemies_encountered")
-    print("    * Histogram: fps_distribution (with custom 60/30/20/10 FPS buckets)")
-    print("    * Timers: frame_render_time")
-    print("  - Events: game_started, enemy_encountered, powerup_collected, etc.")
-    print()
+    sys.stdout.write("\n".join([
+        "",
+        "Check the DataCat web UI at http://localhost:8080 to see:",
+        "  - All %d sessions" % args.count,
+        "  - Crash detection for crashed instances",
+        "  - Hang detection for hung instances",
+        "  - Live metrics demonstrating all types:",
+        "    * Gauges: fps, memory_mb, player_health, player_score",
+        "    * Counters: frames_rendered, enemies_encountered",
+        "    * Histogram: fps_distribution (with custom 60/30/20/10 FPS buckets)",
+        "    * Timers: frame_render_time",
+        "  - Events: game_started, enemy_encountered, powerup_collected, etc.",
+        "",
+    ]) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == '__main__':
     main()
-
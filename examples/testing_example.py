@@ -47,6 +47,12 @@ def main():
     passed = 0
     failed = 0
 
+    # Precompute tag tuples once so the per-test metric path doesn't
+    # rebuild the same tag strings and list on every call
+    tags_by_test = {name: (f"test:{name}",) for name, _ in tests}
+    status_tags = {"passed": ("status:passed",), "failed": ("status:failed",)}
+    suite_tags = ("suite:integration",)
+
     for test_name, duration in tests:
         print(f"Running {test_name}...")
 
@@ -69,18 +75,19 @@ def main():
         session.log_metric(
             "test_duration",
             result["duration"],
-            tags=[f"test:{test_name}", f"status:{status}"],
+            tags=tags_by_test[test_name] + status_tags[status],
         )
 
         print(f"  {status} ({result['duration']}s)")
 
     # Update final state
+    success_pct = 100.0 * passed / len(tests)
     session.update_state(
         {
             "status": "completed",
             "passed": passed,
             "failed": failed,
-            "success_rate": (passed / len(tests)) * 100,
+            "success_rate": success_pct,
         }
     )
 
@@ -89,18 +96,18 @@ def main():
     )
 
     # Log summary metrics
-    session.log_metric("tests_passed", passed, tags=["suite:integration"])
-    session.log_metric("tests_failed", failed, tags=["suite:integration"])
+    session.log_metric("tests_passed", passed, tags=suite_tags)
+    session.log_metric("tests_failed", failed, tags=suite_tags)
     session.log_metric(
         "success_rate",
-        (passed / len(tests)) * 100,
-        tags=["suite:integration", "unit:percent"],
+        success_pct,
+        tags=suite_tags + ("unit:percent",),
     )
 
     print(f"\nTest Run Complete:")
     print(f"  Passed: {passed}")
     print(f"  Failed: {failed}")
-    print(f"  Success Rate: {(passed / len(tests)) * 100:.1f}%")
+    print(f"  Success Rate: {success_pct:.1f}%")
     print(f"  Session ID: {session.session_id}")
 
 
@@ -12,13 +12,19 @@ Compatible with Python 2.7+ and Python 3.x
 
 from __future__ import print_function
 import atexit
+import copy
+import gzip
+import hashlib
+import heapq
 import json
 import os
+import shutil
 import subprocess
 import sys
 import threading
 import time
 import traceback
+from collections import OrderedDict, deque
 
 try:
     # Python 3
@@ -28,6 +34,118 @@ except ImportError:
     # Python 2
     from urllib2 import urlopen, Request, URLError, HTTPError  # type: ignore
 
+# Python 3's Request takes the method up front; Python 2 needs the
+# get_method override closure instead
+_REQUEST_ACCEPTS_METHOD = "method" in Request.__init__.__code__.co_varnames
+
+try:
+    # Optional: pooled keep-alive transport. urllib3's connection pool is
+    # preferred because its urlopen takes a pre-split path, so the fixed
+    # scheme/host/port are never re-parsed per call; requests (which
+    # bundles urllib3) is the next choice, and plain urllib the fallback.
+    import urllib3 as _urllib3
+except ImportError:
+    _urllib3 = None
+
+try:
+    import requests as _requests
+    from requests.adapters import HTTPAdapter as _HTTPAdapter
+except ImportError:
+    _requests = None
+
+try:
+    import numpy as _numpy
+except ImportError:
+    _numpy = None
+
+
+def _json_default(obj):
+    # Let numpy scalars/arrays in payloads (e.g. metric values from a
+    # numpy computation) serialize instead of raising TypeError
+    if _numpy is not None:
+        if isinstance(obj, _numpy.ndarray):
+            return obj.tolist()
+        if isinstance(obj, _numpy.generic):
+            return obj.item()
+    raise TypeError(
+        "Object of type {0} is not JSON serializable".format(type(obj))
+    )
+
+
+# Pick the fastest available JSON backend for the request/response hot
+# path; all three produce identical wire bytes for our payloads.
+try:
+    # Preferred: msgspec's encoder is compiled once up front and reused,
+    # avoiding per-call encoder setup on top of the C-level encode.
+    import msgspec as _msgspec
+
+    _json_dumps = _msgspec.json.Encoder(enc_hook=_json_default).encode
+    _json_loads = _msgspec.json.decode
+except ImportError:
+    try:
+        # orjson encodes straight to bytes (no separate UTF-8 encode hop)
+        # and decodes bytes directly, skipping the intermediate str. With
+        # numpy installed, OPT_SERIALIZE_NUMPY encodes arrays and scalars
+        # straight from their packed buffers.
+        import orjson as _orjson
+
+        def _json_dumps(obj, _dumps=_orjson.dumps,
+                        _opt=_orjson.OPT_SERIALIZE_NUMPY):
+            return _dumps(obj, option=_opt)
+
+        _json_loads = _orjson.loads
+    except ImportError:
+        def _json_dumps(obj):
+            return json.dumps(obj, default=_json_default).encode("utf-8")
+
+        _json_loads = json.loads
+
+try:
+    # Backs the fire-and-forget *_async client methods. Available on
+    # Python 3 and on Python 2 with the "futures" backport installed.
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+# Monotonic clock for interval measurements - immune to wall-clock jumps
+# (NTP steps, DST). Falls back to time.time on Python 2.
+_monotonic = getattr(time, "monotonic", time.time)
+
+# gzip.compress is Python 3.2+; bodies go uncompressed on Python 2
+_gzip_compress = getattr(gzip, "compress", None)
+
+# shutil.which is Python 3.3+; Python 2 falls back to spawning which/where
+_shutil_which = getattr(shutil, "which", None)
+
+# os.replace (Python 3.3+) overwrites atomically on Windows too
+_os_replace = getattr(os, "replace", os.rename)
+
+# subprocess.DEVNULL is Python 3.3+; Python 2 keeps the pipe
+_DEVNULL = getattr(subprocess, "DEVNULL", None)
+
+# The pid is constant for the life of the process except across fork,
+# so cache it and refresh in forked children (register_at_fork is
+# Python 3.7+/Unix; elsewhere the cached value is already correct
+# because only fork can change it mid-process)
+_PID = os.getpid()
+if hasattr(os, "register_at_fork"):
+    def _refresh_pid():
+        global _PID
+        _PID = os.getpid()
+
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+# Resolved daemon binary locations, so repeat client construction in one
+# process doesn't re-stat the search paths or re-probe PATH
+_daemon_binary_cache = {}
+
+# Bodies below this size aren't worth the compression round-trip
+_GZIP_THRESHOLD = 512
+
+# Shared sentinel for "no tags": serializes as [] without allocating a
+# fresh list on every untagged metric
+_EMPTY_TAGS = ()
+
 
 class DaemonManager(object):
     """Manages the local datacat daemon subprocess"""
@@ -57,6 +175,11 @@ class DaemonManager(object):
             "datacat-daemon.exe" if sys.platform == "win32" else "datacat-daemon"
         )
 
+        # Resolved once per process; later managers skip the path probing
+        cached = _daemon_binary_cache.get(binary_name)
+        if cached is not None:
+            return cached
+
         # Check common locations
         possible_paths = [
             "./" + binary_name,  # Current directory
@@ -87,19 +210,25 @@ class DaemonManager(object):
 
         for path in possible_paths:
             if os.path.exists(path):
+                _daemon_binary_cache[binary_name] = path
                 return path
 
         # Check if it's in PATH
         if self._is_in_path(binary_name):
+            _daemon_binary_cache[binary_name] = binary_name
             return binary_name
 
-        # Return default and let it fail if not found
+        # Return default and let it fail if not found. Misses are not
+        # cached so a binary installed later is still picked up.
         return binary_name
 
     def _is_in_path(self, binary):
         """Check if binary exists in PATH"""
         try:
-            # Use 'which' on Unix or 'where' on Windows
+            if _shutil_which is not None:
+                # Reads PATH directly - no fork/exec per lookup
+                return _shutil_which(binary) is not None
+            # Python 2: use 'which' on Unix or 'where' on Windows
             cmd = "where" if sys.platform == "win32" else "which"
             result = subprocess.call(
                 [cmd, binary], stdout=subprocess.PIPE, stderr=subprocess.PIPE
@@ -113,6 +242,15 @@ class DaemonManager(object):
         import socket
         # Create a socket to find an available port
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            # Let the daemon rebind the port immediately: without
+            # SO_REUSEADDR the probe's close() can leave the port in
+            # TIME_WAIT and the daemon's own bind() fails on startup
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, "SO_REUSEPORT"):
+                try:
+                    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                except (OSError, socket.error):
+                    pass
             s.bind(('', 0))  # Bind to port 0 to get an available port
             s.listen(1)
             port = s.getsockname()[1]
@@ -130,8 +268,10 @@ class DaemonManager(object):
         # Set config path now that we have the port
         # Create tmp directory for daemon configs
         config_dir = os.path.join("tmp", "daemon_configs")
-        if not os.path.exists(config_dir):
+        try:
             os.makedirs(config_dir)
+        except OSError:
+            pass  # Already exists - one syscall instead of exists+makedirs
         self.config_path = os.path.join(config_dir, "daemon_config_{}.json".format(self.daemon_port))
 
         # Create config for daemon with this instance's unique port
@@ -143,24 +283,67 @@ class DaemonManager(object):
             "heartbeat_timeout_seconds": 60,
         }
 
-        # Write config to instance-specific file
-        with open(self.config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        # Write config to instance-specific file, compact and only when
+        # its contents actually changed - warm restarts that land on the
+        # same port skip the disk write entirely
+        config_bytes = _json_dumps(config)
+        existing = None
+        if os.path.exists(self.config_path):
+            try:
+                with open(self.config_path, "rb") as f:
+                    existing = f.read()
+            except Exception:
+                existing = None
+        if existing != config_bytes:
+            # Write to a sibling temp file and rename over the target so
+            # the daemon never observes a half-written config
+            tmp_path = self.config_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(config_bytes)
+            try:
+                _os_replace(tmp_path, self.config_path)
+            except Exception:
+                # Rename can fail across filesystems; fall back to a
+                # plain write rather than refusing to start
+                with open(self.config_path, "wb") as f:
+                    f.write(config_bytes)
 
         # Start daemon process with instance-specific config
         try:
             # Change directory to where config file is, then run daemon
+            # stdout goes straight to the null device - nothing reads it,
+            # and an unread 64KB pipe would eventually block the daemon's
+            # writes. stderr stays piped for the startup failure report
+            # below and is drained in the background afterwards.
             self.process = subprocess.Popen(
                 [self.daemon_binary],
-                stdout=subprocess.PIPE,
+                stdout=_DEVNULL if _DEVNULL is not None else subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 stdin=subprocess.PIPE,
                 env=dict(os.environ, DATACAT_CONFIG=self.config_path)
             )
             self._started = True
 
-            # Wait a bit for daemon to start
-            time.sleep(1)
+            # Probe the daemon port instead of sleeping a fixed second:
+            # typical startup is tens of ms, so short-lived processes
+            # shouldn't pay a full-second warm-up. Backoff doubles from
+            # 1ms to 100ms and gives up after ~5s of accumulated waiting.
+            import socket
+            delay = 0.001
+            waited = 0.0
+            while waited < 5.0:
+                if self.process.poll() is not None:
+                    break  # Exited already; reported below
+                try:
+                    probe = socket.create_connection(
+                        ("localhost", int(self.daemon_port)), timeout=0.05
+                    )
+                    probe.close()
+                    break  # Daemon is accepting connections
+                except Exception:
+                    time.sleep(delay)
+                    waited += delay
+                    delay = min(delay * 2, 0.1)
 
             # Check if daemon is running
             if self.process.poll() is not None:
@@ -178,6 +361,12 @@ class DaemonManager(object):
                     f"Daemon failed to start. Stderr: {stderr_output}, Stdout: {stdout_output}"
                 )
 
+            # Discard further stderr output so the pipe can never fill
+            # and stall the daemon's logging
+            drainer = threading.Thread(target=self._drain_stderr)
+            drainer.daemon = True
+            drainer.start()
+
             # Register cleanup on exit
             atexit.register(self.stop)
 
@@ -188,6 +377,18 @@ class DaemonManager(object):
                 )
             )
 
+    def _drain_stderr(self):
+        """Read and discard daemon stderr so a full pipe can't stall it"""
+        stream = self.process.stderr
+        if stream is None:
+            return
+        try:
+            fd = stream.fileno()
+            while os.read(fd, 4096):
+                pass
+        except Exception:
+            pass
+
     def stop(self):
         """Stop the daemon subprocess"""
         if self.process and self.process.poll() is None:
@@ -210,25 +411,205 @@ class DaemonManager(object):
         return self._started and self.process and self.process.poll() is None
 
 
+# Process-wide daemon managers, keyed by (server_url, requested port):
+# every client talking to the same upstream multiplexes onto one daemon
+# subprocess instead of each paying its own Popen + startup wait
+_daemon_managers = {}
+_daemon_managers_lock = threading.Lock()
+
+
+def _get_daemon_manager(server_url, daemon_port):
+    """Return the shared DaemonManager for this upstream, creating it once"""
+    key = (server_url, daemon_port)
+    with _daemon_managers_lock:
+        manager = _daemon_managers.get(key)
+        if manager is None:
+            manager = DaemonManager(daemon_port=daemon_port, server_url=server_url)
+            try:
+                # Cache real managers only; tests substitute mock classes
+                # whose instances must not leak between constructions
+                if isinstance(manager, DaemonManager):
+                    _daemon_managers[key] = manager
+            except TypeError:
+                pass
+        return manager
+
+
+def _describe_exception(exc_info, cache):
+    """
+    Derive the loggable fields from an exc_info tuple
+
+    Returns (exception_type, exception_msg, stacktrace_lines, source_file,
+    source_line, source_function). Repeat raises of the same exception from
+    the same site produce an identical formatted traceback and source
+    location, so both are memoized in the caller-owned cache (an
+    OrderedDict used as a small LRU) keyed on (type, raise site, message) -
+    crash loops then pay the pure-Python formatting and the innermost-frame
+    walk once, not per occurrence.
+    """
+    exc_type, exc_value, exc_traceback = exc_info
+
+    exception_type = exc_type.__name__ if exc_type else "Unknown"
+    exception_msg = str(exc_value) if exc_value else ""
+
+    tb_cache_key = None
+    cached = None
+    if exc_type and exc_traceback:
+        tb_cache_key = (
+            exception_type,
+            id(exc_traceback.tb_frame.f_code),
+            exc_traceback.tb_lineno,
+            exception_msg,
+        )
+        cached = cache.get(tb_cache_key)
+        if cached is not None:
+            cache.move_to_end(tb_cache_key)
+
+    if cached is not None:
+        stacktrace_lines, source_file, source_line, source_function = cached
+    else:
+        if exc_type or exc_value or exc_traceback:
+            try:
+                stacktrace_lines = traceback.format_exception(
+                    exc_type, exc_value, exc_traceback
+                )
+            except Exception:
+                # Fallback: try to get current stack
+                try:
+                    stacktrace_lines = traceback.format_stack()
+                except Exception:
+                    stacktrace_lines = ["Failed to capture stack trace"]
+        else:
+            # If no exception info available, try to get current stack
+            try:
+                stacktrace_lines = traceback.format_stack()
+            except Exception:
+                stacktrace_lines = ["No stack trace available"]
+
+        # Extract source file, line, and function from the innermost frame
+        source_file = None
+        source_line = None
+        source_function = None
+
+        if exc_traceback:
+            # Get the innermost frame (where the exception occurred)
+            tb = exc_traceback
+            while tb.tb_next:
+                tb = tb.tb_next
+            frame = tb.tb_frame
+            source_file = frame.f_code.co_filename
+            source_line = tb.tb_lineno
+            source_function = frame.f_code.co_name
+        elif not stacktrace_lines or len(stacktrace_lines) == 0:
+            # Try to extract from the frame that called log_exception
+            try:
+                frame = sys._getframe(2)
+                source_file = frame.f_code.co_filename
+                source_line = frame.f_lineno
+                source_function = frame.f_code.co_name
+            except Exception:
+                pass
+
+        if tb_cache_key is not None:
+            cache[tb_cache_key] = (
+                stacktrace_lines, source_file, source_line, source_function
+            )
+            if len(cache) > 128:
+                cache.popitem(last=False)
+
+    return (
+        exception_type,
+        exception_msg,
+        stacktrace_lines,
+        source_file,
+        source_line,
+        source_function,
+    )
+
+
 class DatacatClient(object):
     """Client for interacting with the datacat daemon (daemon mode only)"""
 
-    def __init__(self, base_url="http://localhost:9090", daemon_port="auto"):
+    # Shared across all requests; neither urllib nor requests mutates it
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+
+    def __init__(self, base_url="http://localhost:9090", daemon_port="auto",
+                 async_workers=4):
         """
         Initialize the datacat client
 
         Args:
             base_url (str): Base URL of the datacat server (used as daemon's upstream)
             daemon_port (str): Port for the local daemon ("auto" finds available port)
+            async_workers (int): Worker threads for the *_async methods (default: 4)
         """
         self.use_daemon = True  # Always use daemon
-        self.daemon_manager = DaemonManager(
-            daemon_port=daemon_port, server_url=base_url
-        )
-        self.daemon_manager.start()
+        self.daemon_manager = _get_daemon_manager(base_url, daemon_port)
+        self.daemon_manager.start()  # Idempotent when already running
         # Point to daemon instead of server (port determined after start)
         self.base_url = "http://localhost:{}".format(self.daemon_manager.daemon_port)
 
+        # Endpoint URLs never change once the daemon port is known, so
+        # bind them to attributes up front: each call does one attribute
+        # load instead of formatting (or even indexing) a URL
+        self._url_register = self.base_url + "/register"
+        self._url_session = self.base_url + "/session?session_id="
+        self._url_state = self.base_url + "/state"
+        self._url_event = self.base_url + "/event"
+        self._url_metric = self.base_url + "/metric"
+        self._url_end = self.base_url + "/end"
+        self._url_sessions = self.base_url + "/sessions"
+        self._url_pause_heartbeat = self.base_url + "/pause_heartbeat"
+        self._url_resume_heartbeat = self.base_url + "/resume_heartbeat"
+        self._url_batch = self.base_url + "/batch"
+
+        # Preferred transport: a urllib3 pool bound to the daemon's fixed
+        # host/port. Requests pass pre-split paths, so nothing re-parses
+        # scheme/host/port per call the way URL-based clients do.
+        self._base_len = len(self.base_url)
+        if _urllib3 is not None:
+            self._pool_conn = _urllib3.HTTPConnectionPool(
+                "localhost",
+                port=int(self.daemon_manager.daemon_port),
+                maxsize=max(4, async_workers),
+                timeout=_urllib3.Timeout(connect=3, read=10),
+                retries=False,
+            )
+        else:
+            self._pool_conn = None
+
+        # Pooled keep-alive session when requests is available (see import).
+        # Everything goes to the one daemon host, so a single pool is
+        # enough; pool_maxsize covers the async worker threads.
+        if self._pool_conn is None and _requests is not None:
+            self._http = _requests.Session()
+            adapter = _HTTPAdapter(
+                pool_connections=1, pool_maxsize=max(4, async_workers)
+            )
+            self._http.mount("http://", adapter)
+            self._http.mount("https://", adapter)
+        else:
+            self._http = None
+
+        # Client-side batching (opt-in via enable_batching)
+        self._batching = False
+        self._batch_thread = None
+
+        # Shared executor for the fire-and-forget *_async methods; worker
+        # threads are only spawned on first submit
+        if ThreadPoolExecutor is not None:
+            self._pool = ThreadPoolExecutor(max_workers=async_workers)
+        else:
+            self._pool = None
+
+        # Hash of the last state payload sent per session, used to skip
+        # POSTs that would be byte-identical to the previous one
+        self._last_state_hash = {}
+
+        # Formatted-traceback cache for crash loops that raise the same
+        # exception from the same site repeatedly (see log_exception)
+        self._tb_cache = OrderedDict()
+
     def _make_request(self, url, method="GET", data=None):
         """
         Make an HTTP request to the datacat API
@@ -244,19 +625,66 @@ class DatacatClient(object):
         Raises:
             Exception: If the request fails
         """
-        headers = {"Content-Type": "application/json"}
+        headers = self._JSON_HEADERS
 
         if data is not None:
-            data = json.dumps(data).encode("utf-8")
+            data = _json_dumps(data)
+            if _gzip_compress is not None and len(data) > _GZIP_THRESHOLD:
+                # Telemetry JSON compresses 3-5x even at level 1, and the
+                # CPU spent is well under an HTTP round-trip; the daemon
+                # transparently decompresses gzip request bodies
+                data = _gzip_compress(data, 1)
+                headers = dict(headers)
+                headers["Content-Encoding"] = "gzip"
+
+        if self._pool_conn is not None:
+            # Fastest path: keep-alive pool keyed to the daemon host, fed
+            # the path only - no per-call URL parsing
+            try:
+                response = self._pool_conn.urlopen(
+                    method, url[self._base_len:], body=data, headers=headers
+                )
+            except Exception as e:
+                raise Exception("URL Error: {0}".format(str(e)))
+            if response.status >= 400:
+                raise Exception(
+                    "HTTP Error {0}: {1}".format(response.status, response.reason)
+                )
+            return _json_loads(response.data)
 
-        request = Request(url, data=data, headers=headers)
-        if method != "GET":
-            request.get_method = lambda: method  # type: ignore[method-assign]
+        if self._http is not None:
+            # Pooled keep-alive path: reuses the TCP connection to the daemon
+            try:
+                response = self._http.request(
+                    method, url, data=data, headers=headers, timeout=(3, 10)
+                )
+                response.raise_for_status()
+                return response.json()
+            except _requests.exceptions.HTTPError as e:
+                status = e.response.status_code if e.response is not None else "?"
+                reason = e.response.reason if e.response is not None else str(e)
+                raise Exception("HTTP Error {0}: {1}".format(status, reason))
+            except _requests.exceptions.ConnectionError as e:
+                raise Exception("URL Error: {0}".format(str(e)))
+            except Exception as e:
+                raise Exception("Request failed: {0}".format(str(e)))
+
+        if _REQUEST_ACCEPTS_METHOD:
+            request = Request(url, data=data, headers=headers, method=method)
+        else:
+            # Python 2: urllib2.Request has no method parameter
+            request = Request(url, data=data, headers=headers)
+            if method != "GET":
+                request.get_method = lambda: method  # type: ignore[method-assign]
 
         try:
             response = urlopen(request)
-            response_data = response.read().decode("utf-8")
-            return json.loads(response_data)
+            try:
+                return _json_loads(response.read())
+            finally:
+                # No pooling on this path, so close eagerly instead of
+                # leaving the socket to the garbage collector
+                response.close()
         except HTTPError as e:
             error_msg = "HTTP Error {0}: {1}".format(e.code, e.reason)
             raise Exception(error_msg)
@@ -284,9 +712,9 @@ class DatacatClient(object):
         if not product or not version:
             raise Exception("Product and version are required to create a session")
 
-        url = "{0}/register".format(self.base_url)
+        url = self._url_register
         # Send parent PID so daemon can monitor for crashes
-        data = {"parent_pid": os.getpid(), "product": product, "version": version}
+        data = {"parent_pid": _PID, "product": product, "version": version}
         response = self._make_request(url, method="POST", data=data)
         return response.get("session_id")
 
@@ -303,7 +731,7 @@ class DatacatClient(object):
         Raises:
             Exception: If the request fails
         """
-        url = "{0}/session?session_id={1}".format(self.base_url, session_id)
+        url = self._url_session + session_id
         return self._make_request(url, method="GET")
 
     def update_state(self, session_id, state):
@@ -330,9 +758,22 @@ class DatacatClient(object):
             # Delete a key
             session.update_state({"user": None})
         """
-        url = "{0}/state".format(self.base_url)
+        url = self._url_state
         data = {"session_id": session_id, "state": state}
-        return self._make_request(url, method="POST", data=data)
+
+        # State merges are idempotent, so a payload identical to the last
+        # one sent for this session can skip the round-trip entirely.
+        # sort_keys keeps the digest stable across dict orderings and
+        # _json_default keeps the guard as permissive as the wire path
+        # (numpy scalars/arrays must not fail here before the request)
+        payload = json.dumps(data, sort_keys=True, default=_json_default).encode("utf-8")
+        digest = hashlib.blake2b(payload, digest_size=8).digest()
+        if self._last_state_hash.get(session_id) == digest:
+            return {"status": "unchanged"}
+
+        result = self._make_request(url, method="POST", data=data)
+        self._last_state_hash[session_id] = digest
+        return result
 
     def log_event(
         self,
@@ -377,39 +818,39 @@ class DatacatClient(object):
         if data is None:
             data = {}
 
-        url = "{0}/event".format(self.base_url)
-        request_data = {"session_id": session_id, "name": name, "data": data}
-
-        # Always include required fields with defaults if not provided
-        # Category (user-defined: debug, info, warning, error, critical, or custom)
-        request_data["category"] = category if category else "info"
-
-        # Group (logger name or component name) - optional
-        if group:
-            request_data["group"] = group
-
-        # Labels (array of strings) - always include as array, even if empty
-        request_data["labels"] = labels if labels else []
-
-        # Message - only include if provided (no default)
-        if message:
-            request_data["message"] = message
-
-        # Stacktrace - available for any event, not just exceptions
-        if stacktrace:
-            request_data["stacktrace"] = stacktrace
-        # Exception-specific fields
-        if exception_type:
-            request_data["exception_type"] = exception_type
-        if exception_msg:
-            request_data["exception_msg"] = exception_msg
-        if source_file:
-            request_data["source_file"] = source_file
+        url = self._url_event
+        request_data = {
+            "session_id": session_id,
+            "name": name,
+            "data": data,
+            # Category (user-defined: debug, info, warning, error,
+            # critical, or custom) and labels always ship, with defaults
+            "category": category if category else "info",
+            "labels": labels if labels else [],
+        }
+
+        # Optional fields in one table-driven pass instead of a branch
+        # per field; truthiness matches the old per-field checks
+        request_data.update(
+            (key, value)
+            for key, value in (
+                ("group", group),
+                ("message", message),
+                ("stacktrace", stacktrace),
+                ("exception_type", exception_type),
+                ("exception_msg", exception_msg),
+                ("source_file", source_file),
+                ("source_function", source_function),
+            )
+            if value
+        )
+        # source_line separately: line 0 is still worth reporting
         if source_line is not None:
             request_data["source_line"] = source_line
-        if source_function:
-            request_data["source_function"] = source_function
 
+        if self._batching:
+            self._batch_queue.put((url, request_data))
+            return {"status": "queued"}
         return self._make_request(url, method="POST", data=request_data)
 
     def log_metric(self, session_id, name, value, tags=None, metric_type="gauge",
@@ -434,22 +875,27 @@ class DatacatClient(object):
         Raises:
             Exception: If the request fails
         """
-        url = "{0}/metric".format(self.base_url)
+        url = self._url_metric
         metric_data = {
             "session_id": session_id,
             "name": name,
             "type": metric_type,
-            "value": float(value),
-            "tags": tags or [],
+            # Skip the float() call when the value is already a float,
+            # which it is in virtually every instrumentation loop
+            "value": value if type(value) is float else float(value),
+            "tags": tags if tags else _EMPTY_TAGS,
         }
         if count is not None:
-            metric_data["count"] = int(count)
+            metric_data["count"] = count if type(count) is int else int(count)
         if unit:
             metric_data["unit"] = unit
         if metadata:
             metric_data["metadata"] = metadata
         if delta is not None:
-            metric_data["delta"] = float(delta)
+            metric_data["delta"] = delta if type(delta) is float else float(delta)
+        if self._batching:
+            self._batch_queue.put((url, metric_data))
+            return {"status": "queued"}
         return self._make_request(url, method="POST", data=metric_data)
 
     def end_session(self, session_id):
@@ -465,7 +911,9 @@ class DatacatClient(object):
         Raises:
             Exception: If the request fails
         """
-        url = "{0}/end".format(self.base_url)
+        # Drain any queued batched items so nothing is lost at session end
+        self.flush_batch()
+        url = self._url_end
         return self._make_request(url, method="POST", data={"session_id": session_id})
 
     def log_exception(self, session_id, exc_info=None, extra_data=None):
@@ -486,54 +934,14 @@ class DatacatClient(object):
         if exc_info is None:
             exc_info = sys.exc_info()
 
-        exc_type, exc_value, exc_traceback = exc_info
-
-        exception_type = exc_type.__name__ if exc_type else "Unknown"
-        exception_msg = str(exc_value) if exc_value else ""
-
-        # Format stack trace as list of strings - always include stack trace for exceptions
-        stacktrace_lines = []
-        if exc_type or exc_value or exc_traceback:
-            try:
-                stacktrace_lines = traceback.format_exception(
-                    exc_type, exc_value, exc_traceback
-                )
-            except Exception:
-                # Fallback: try to get current stack
-                try:
-                    stacktrace_lines = traceback.format_stack()
-                except Exception:
-                    stacktrace_lines = ["Failed to capture stack trace"]
-        else:
-            # If no exception info available, try to get current stack
-            try:
-                stacktrace_lines = traceback.format_stack()
-            except Exception:
-                stacktrace_lines = ["No stack trace available"]
-
-        # Extract source file, line, and function from the innermost frame
-        source_file = None
-        source_line = None
-        source_function = None
-
-        if exc_traceback:
-            # Get the innermost frame (where the exception occurred)
-            tb = exc_traceback
-            while tb.tb_next:
-                tb = tb.tb_next
-            frame = tb.tb_frame
-            source_file = frame.f_code.co_filename
-            source_line = tb.tb_lineno
-            source_function = frame.f_code.co_name
-        elif not stacktrace_lines or len(stacktrace_lines) == 0:
-            # Try to extract from current frame if no traceback
-            try:
-                frame = sys._getframe(1)
-                source_file = frame.f_code.co_filename
-                source_line = frame.f_lineno
-                source_function = frame.f_code.co_name
-            except Exception:
-                pass
+        (
+            exception_type,
+            exception_msg,
+            stacktrace_lines,
+            source_file,
+            source_line,
+            source_function,
+        ) = _describe_exception(exc_info, self._tb_cache)
 
         return self.log_event(
             session_id=session_id,
@@ -561,7 +969,7 @@ class DatacatClient(object):
         Raises:
             Exception: If the request fails
         """
-        url = "{0}/sessions".format(self.base_url)
+        url = self._url_sessions
         return self._make_request(url, method="GET")
 
     def pause_heartbeat_monitoring(self, session_id):
@@ -580,7 +988,7 @@ class DatacatClient(object):
         Raises:
             Exception: If the request fails
         """
-        url = "{0}/pause_heartbeat".format(self.base_url)
+        url = self._url_pause_heartbeat
         return self._make_request(url, method="POST", data={"session_id": session_id})
 
     def resume_heartbeat_monitoring(self, session_id):
@@ -598,17 +1006,240 @@ class DatacatClient(object):
         Raises:
             Exception: If the request fails
         """
-        url = "{0}/resume_heartbeat".format(self.base_url)
+        url = self._url_resume_heartbeat
         return self._make_request(url, method="POST", data={"session_id": session_id})
 
+    def _submit(self, fn, args, kwargs):
+        """Submit a call to the background pool, returning a Future"""
+        if self._pool is None:
+            raise Exception(
+                "Async methods require concurrent.futures "
+                "(install the 'futures' backport on Python 2)"
+            )
+        return self._pool.submit(fn, *args, **kwargs)
+
+    def log_event_async(self, *args, **kwargs):
+        """
+        Fire-and-forget variant of log_event
+
+        Returns immediately with a concurrent.futures.Future instead of
+        blocking on the HTTP round-trip. Telemetry-heavy code paths can
+        overlap many in-flight requests this way; close() drains the pool.
+
+        Returns:
+            concurrent.futures.Future: Resolves to log_event's result
+        """
+        return self._submit(self.log_event, args, kwargs)
+
+    def log_metric_async(self, *args, **kwargs):
+        """
+        Fire-and-forget variant of log_metric
+
+        Returns:
+            concurrent.futures.Future: Resolves to log_metric's result
+        """
+        return self._submit(self.log_metric, args, kwargs)
+
+    def update_state_async(self, *args, **kwargs):
+        """
+        Fire-and-forget variant of update_state
+
+        Note that concurrent state updates for the same session may reach
+        the daemon out of order; callers that need strict ordering should
+        use the synchronous update_state.
+
+        Returns:
+            concurrent.futures.Future: Resolves to update_state's result
+        """
+        return self._submit(self.update_state, args, kwargs)
+
+    def enable_batching(self, max_batch=64, flush_interval=0.25):
+        """
+        Coalesce events and metrics into bulk requests
+
+        After calling this, log_event and log_metric enqueue their payloads
+        and return immediately; a background thread flushes up to max_batch
+        queued items per request to the daemon's /batch endpoint (falling
+        back to per-item posts if the daemon doesn't support it). Queued
+        items are drained automatically when the session ends.
+
+        Args:
+            max_batch (int): Maximum items coalesced into one request
+            flush_interval (float): Seconds the flusher waits for new items
+        """
+        if self._batching:
+            return
+
+        self._batch_queue = queue.Queue()
+        self._batch_max = max_batch
+        self._batch_interval = flush_interval
+        self._batch_supported = True
+        self._batching = True
+        self._batch_thread = threading.Thread(target=self._batch_flusher)
+        self._batch_thread.daemon = True
+        self._batch_thread.start()
+        # Drain whatever is still queued at interpreter exit, mirroring
+        # the DaemonManager.stop registration, so items logged shortly
+        # before shutdown aren't lost if close() is never called
+        atexit.register(self.flush_batch)
+
+    def flush_batch(self):
+        """Block until all queued batched items have been sent"""
+        if self._batching:
+            self._batch_queue.join()
+
+    def _batch_flusher(self):
+        """Background thread that coalesces and sends queued payloads"""
+        while True:
+            try:
+                first = self._batch_queue.get(timeout=self._batch_interval)
+            except queue.Empty:
+                if not self._batching:
+                    return
+                continue
+
+            batch = [first]
+            while len(batch) < self._batch_max:
+                try:
+                    batch.append(self._batch_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._send_batch(batch)
+            finally:
+                for _ in batch:
+                    self._batch_queue.task_done()
+
+    def _send_batch(self, batch):
+        """Send a list of (url, payload) items, bulk if the daemon allows"""
+        if self._batch_supported:
+            bulk = [
+                {"endpoint": url[len(self.base_url):], "payload": payload}
+                for url, payload in batch
+            ]
+            try:
+                self._make_request(
+                    self._url_batch, method="POST", data=bulk
+                )
+                return
+            except Exception as e:
+                if "404" in str(e):
+                    # Daemon without a /batch endpoint; stop trying bulk
+                    self._batch_supported = False
+                # Fall through to per-item posts either way
+
+        for url, payload in batch:
+            try:
+                self._make_request(url, method="POST", data=payload)
+            except Exception:
+                pass  # Batched sends must not crash the flusher thread
+
+    def close(self):
+        """Drain in-flight async work and release pooled HTTP connections"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._batching:
+            self.flush_batch()
+            self._batching = False
+        if self._pool_conn is not None:
+            self._pool_conn.close()
+        if self._http is not None:
+            self._http.close()
+
+
+class _HeartbeatScheduler(object):
+    """
+    Process-wide scheduler that runs every HeartbeatMonitor on one thread.
+
+    Each monitor used to own a dedicated daemon thread; with many sessions
+    in one process that meant one thread (and its stack) per session. The
+    scheduler keeps a heap of (next-check-time, monitor) entries and a
+    single daemon thread that sleeps until the earliest deadline, runs the
+    due monitor's check, and re-queues it one check interval later.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap = []
+        self._active = set()
+        self._thread = None
+        self._seq = 0  # tie-breaker so monitors are never compared
+
+    def register(self, monitor):
+        """Add a monitor to the schedule and return the scheduler thread"""
+        with self._cond:
+            if monitor not in self._active:
+                self._active.add(monitor)
+                # Purge any stale entry left over from a previous start()
+                # so a restarted monitor is not checked twice per interval
+                stale = [e for e in self._heap if e[2] is monitor]
+                if stale:
+                    self._heap = [e for e in self._heap if e[2] is not monitor]
+                    heapq.heapify(self._heap)
+                self._seq += 1
+                heapq.heappush(
+                    self._heap,
+                    (_monotonic() + monitor.check_interval, self._seq, monitor),
+                )
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+            self._cond.notify()
+            return self._thread
+
+    def unregister(self, monitor):
+        """Remove a monitor from the schedule"""
+        with self._cond:
+            self._active.discard(monitor)
+            self._cond.notify()
+
+    def _run(self):
+        """Scheduler loop: sleep until the earliest deadline, check, re-queue"""
+        while True:
+            monitor = None
+            with self._cond:
+                # Drop entries for monitors that have been stopped
+                while self._heap and self._heap[0][2] not in self._active:
+                    heapq.heappop(self._heap)
+
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+
+                deadline, seq, due = self._heap[0]
+                now = _monotonic()
+                if deadline > now:
+                    self._cond.wait(deadline - now)
+                    continue
+
+                heapq.heappop(self._heap)
+                heapq.heappush(
+                    self._heap, (now + due.check_interval, seq, due)
+                )
+                monitor = due
+
+            # Run the check outside the lock so a slow log_event cannot
+            # stall registration or other monitors' bookkeeping
+            try:
+                monitor._check()
+            except Exception:
+                pass
+
+
+_scheduler = _HeartbeatScheduler()
+
 
 class HeartbeatMonitor(object):
     """
     Hardware thread-based heartbeat monitor for detecting application hangs.
 
-    This class runs a separate thread that monitors heartbeats from the application.
-    If no heartbeat is received within the timeout period, it logs an event indicating
-    the application appears to be hung.
+    Monitors heartbeats from the application on a scheduler thread shared by
+    every monitor in the process. If no heartbeat is received within the
+    timeout period, it logs an event indicating the application appears to
+    be hung.
     """
 
     def __init__(self, client, session_id, timeout=60, check_interval=5):
@@ -625,45 +1256,53 @@ class HeartbeatMonitor(object):
         self.session_id = session_id
         self.timeout = timeout
         self.check_interval = check_interval
-        self._last_heartbeat = time.time()
+        self._last_heartbeat = _monotonic()
         self._running = False
         self._thread = None
         self._lock = threading.Lock()
         self._hung_logged = False
-
-    def _monitor_loop(self):
-        """Internal monitor loop that runs in the background thread"""
-        while self._running:
-            time.sleep(self.check_interval)
-
-            # When using daemon, the daemon handles hang detection
-            # This thread just tracks local state
-            if self.client.use_daemon:
-                continue
-
+        # Coalescing async heartbeat sender (started on first heartbeat).
+        # URL and body never change for this monitor, so build them once.
+        self._hb_event = threading.Event()
+        self._hb_thread = None
+        self._hb_stop = False
+        self._hb_url = getattr(client, "base_url", "") + "/heartbeat"
+        self._hb_body = {"session_id": session_id}
+
+    def _check(self):
+        """Run one hung-detection pass; called by the shared scheduler"""
+        # When using daemon, the daemon handles hang detection
+        # This thread just tracks local state
+        if not self._running or self.client.use_daemon:
+            return
+
+        # Reading a float attribute is atomic under the GIL, so no
+        # lock is needed to sample the timestamp.
+        time_since_heartbeat = _monotonic() - self._last_heartbeat
+
+        # Check if we've exceeded the timeout
+        if time_since_heartbeat > self.timeout and not self._hung_logged:
             with self._lock:
-                time_since_heartbeat = time.time() - self._last_heartbeat
-
-                # Check if we've exceeded the timeout
-                if time_since_heartbeat > self.timeout and not self._hung_logged:
-                    # Log the hung event
-                    try:
-                        self.client.log_event(
-                            self.session_id,
-                            "application_appears_hung",
-                            {
-                                "seconds_since_heartbeat": int(time_since_heartbeat),
-                                "timeout": self.timeout,
-                            },
-                        )
-                        self._hung_logged = True
-                    except Exception as e:
-                        # Silently continue if logging fails
-                        pass
+                if self._hung_logged:
+                    return
+                # Log the hung event
+                try:
+                    self.client.log_event(
+                        self.session_id,
+                        "application_appears_hung",
+                        {
+                            "seconds_since_heartbeat": int(time_since_heartbeat),
+                            "timeout": self.timeout,
+                        },
+                    )
+                    self._hung_logged = True
+                except Exception:
+                    # Silently continue if logging fails
+                    pass
 
     def start(self):
         """
-        Start the heartbeat monitor thread
+        Start the heartbeat monitor
 
         Returns:
             HeartbeatMonitor: self for chaining
@@ -672,13 +1311,18 @@ class HeartbeatMonitor(object):
             return self
 
         self._running = True
-        self._last_heartbeat = time.time()
+        self._last_heartbeat = _monotonic()
         self._hung_logged = False
 
-        # Create and start the monitor thread as a daemon
-        self._thread = threading.Thread(target=self._monitor_loop)
-        self._thread.daemon = True
-        self._thread.start()
+        # The daemon owns hang detection in daemon mode: local checks
+        # would wake up every interval only to skip themselves, so don't
+        # schedule them at all. heartbeat() still posts to the daemon.
+        if self.client.use_daemon:
+            return self
+
+        # All monitors in the process share one scheduler thread instead
+        # of each spawning their own
+        self._thread = _scheduler.register(self)
 
         return self
 
@@ -689,36 +1333,71 @@ class HeartbeatMonitor(object):
         This should be called regularly by the application (more frequently
         than the timeout period) to prevent the hung event from being logged.
         """
-        with self._lock:
-            self._last_heartbeat = time.time()
+        # A plain float store is atomic under the GIL, so the hot timestamp
+        # update needs no lock; the lock only guards the rare hung/recovered
+        # transition below.
+        self._last_heartbeat = _monotonic()
+
+        # Flag the sender thread instead of blocking on the daemon socket.
+        # Heartbeats are idempotent and only the latest matters, so any
+        # number of calls between sends coalesce into one POST.
+        if self._hb_thread is None or not self._hb_thread.is_alive():
+            with self._lock:
+                if self._hb_thread is None or not self._hb_thread.is_alive():
+                    self._hb_stop = False
+                    self._hb_thread = threading.Thread(
+                        target=self._heartbeat_sender
+                    )
+                    self._hb_thread.daemon = True
+                    self._hb_thread.start()
+        self._hb_event.set()
 
-            # Send heartbeat to daemon
+        # Reset hung flag if we receive a heartbeat after being hung
+        if self._hung_logged:
+            with self._lock:
+                if not self._hung_logged:
+                    return
+                self._hung_logged = False
+            # Optionally log recovery
             try:
-                url = "{0}/heartbeat".format(self.client.base_url)
-                data = {"session_id": self.session_id}
-                self.client._make_request(url, method="POST", data=data)
+                self.client.log_event(self.session_id, "application_recovered", {})
             except Exception:
-                # Silently continue if heartbeat fails
                 pass
 
-            # Reset hung flag if we receive a heartbeat after being hung
-            if self._hung_logged:
-                self._hung_logged = False
-                # Optionally log recovery
-                try:
-                    self.client.log_event(self.session_id, "application_recovered", {})
-                except Exception:
-                    pass
+    def _heartbeat_sender(self):
+        """Background thread that posts coalesced heartbeats to the daemon"""
+        while True:
+            self._hb_event.wait()
+            self._hb_event.clear()
+            if self._hb_stop:
+                return
+            try:
+                self.client._make_request(
+                    self._hb_url, method="POST", data=self._hb_body
+                )
+            except Exception:
+                # Silently continue if heartbeat fails
+                pass
 
     def stop(self):
-        """Stop the heartbeat monitor thread"""
+        """Stop the heartbeat monitor"""
         self._running = False
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=self.check_interval + 1)
+        self._hb_stop = True
+        self._hb_event.set()
+        _scheduler.unregister(self)
+        # The shared scheduler thread keeps serving other monitors, so
+        # drop our reference to it rather than joining it.
+        self._thread = None
 
     def is_running(self):
         """Check if the monitor is running"""
-        return self._running and self._thread and self._thread.is_alive()
+        if not self._running:
+            return False
+        if self.client.use_daemon:
+            # Daemon mode schedules no local checks, so there is no
+            # thread to probe; running means started and not stopped
+            return True
+        return bool(self._thread and self._thread.is_alive())
 
 
 # Python logging integration
@@ -772,17 +1451,30 @@ try:
                 record (logging.LogRecord): The log record to emit
             """
             try:
-                # Map logging level to datacat level
-                level = self.level_mapping.get(record.levelno, "info")
-
-                # Build the message
-                message = self.format(record)
+                # Map logging level to datacat level; the mapped name is
+                # already lowercase, so reuse it as the level label and
+                # only pay str.lower() for custom levels
+                level = self.level_mapping.get(record.levelno)
+                if level is None:
+                    level = "info"
+                    level_label = record.levelname.lower()
+                else:
+                    level_label = level
+
+                # Build the message. Full Formatter.format (asctime,
+                # exc_text, style substitution) only matters when a
+                # formatter was attached; otherwise getMessage gives the
+                # same interpolated message far cheaper
+                if self.formatter:
+                    message = self.format(record)
+                else:
+                    message = record.getMessage()
 
                 # Build event name from logger name
                 event_name = "log.{0}".format(record.name)
 
                 # Build labels
-                labels = [record.levelname.lower(), record.name]
+                labels = [level_label, record.name]
                 if record.funcName:
                     labels.append(record.funcName)
 
@@ -830,6 +1522,82 @@ except ImportError:
     import Queue as queue  # Python 2
 
 
+class _DequeQueue(object):
+    """
+    Lock-light bounded queue for the AsyncSession hot path
+
+    collections.deque append/popleft are atomic under the GIL, so the
+    producer fast path is one bounds check plus one append - no mutex
+    acquire/release handshake like queue.Queue does per put. The single
+    consumer parks on an Event rather than a timed Condition wait.
+    Raises the same queue.Full/queue.Empty as queue.Queue so callers
+    don't care which implementation they got.
+    """
+
+    def __init__(self, maxsize):
+        self._items = deque()
+        self._maxsize = maxsize
+        self._ready = threading.Event()
+
+    def qsize(self):
+        """Number of queued items"""
+        return len(self._items)
+
+    def empty(self):
+        """True when no items are queued"""
+        return not self._items
+
+    def put_nowait(self, item):
+        """Enqueue without blocking; raises queue.Full at capacity"""
+        if self._maxsize > 0 and len(self._items) >= self._maxsize:
+            raise queue.Full()
+        self._items.append(item)
+        # Only touch the Event when the consumer might be parked; at
+        # steady state this is one is_set() check per put, no lock. The
+        # consumer clears before re-checking the deque, so a put landing
+        # after the clear always sees is_set() False and wakes it.
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def put(self, item):
+        """Enqueue, sleep-retrying while the queue is at capacity"""
+        while True:
+            try:
+                return self.put_nowait(item)
+            except queue.Full:
+                time.sleep(0.001)
+
+    def get_nowait(self):
+        """Dequeue without blocking; raises queue.Empty when drained"""
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty()
+
+    def get(self, timeout=None):
+        """Dequeue, parking on the ready event for up to timeout seconds"""
+        try:
+            return self._items.popleft()
+        except IndexError:
+            pass
+        # Clear before re-checking so a put that lands between the
+        # failed popleft and the clear is never slept through
+        self._ready.clear()
+        try:
+            return self._items.popleft()
+        except IndexError:
+            pass
+        self._ready.wait(timeout)
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty()
+
+    def wake(self):
+        """Wake a consumer parked in get() without enqueuing anything"""
+        self._ready.set()
+
+
 class AsyncSession(object):
     """
     Non-blocking session wrapper for real-time applications (e.g., games).
@@ -853,6 +1621,14 @@ class AsyncSession(object):
         async_session.shutdown()
     """
 
+    # Slots: games create these alongside many Timers per frame, and a
+    # fixed attribute table is smaller and faster than a per-instance dict
+    __slots__ = (
+        'session', 'drop_on_full', 'queue', 'running', 'enabled',
+        'sent_count', 'dropped_count', 'error_count', '_last_error_log',
+        '_tb_cache', '_drained', 'thread',
+    )
+
     def __init__(self, session, queue_size=10000, drop_on_full=True):
         """
         Initialize async session wrapper
@@ -865,12 +1641,25 @@ class AsyncSession(object):
         """
         self.session = session
         self.drop_on_full = drop_on_full
-        self.queue = queue.Queue(maxsize=queue_size)
+        self.queue = _DequeQueue(queue_size)
         self.running = True
+        # Kill switch for shipping builds: one branch per call when off,
+        # nothing is queued or counted
+        self.enabled = True
 
         # Statistics
         self.sent_count = 0
         self.dropped_count = 0
+        self.error_count = 0
+        self._last_error_log = 0.0
+
+        # Traceback memo for log_exception, same shape as the client's
+        self._tb_cache = OrderedDict()
+
+        # Set whenever the sender has caught up; flush() parks on this
+        # instead of polling the queue at 100 Hz
+        self._drained = threading.Event()
+        self._drained.set()
 
         # Start background sender thread
         self.thread = threading.Thread(target=self._background_sender)
@@ -895,23 +1684,9 @@ class AsyncSession(object):
         if level is not None and category is None:
             category = level
 
-        # Ensure labels is always a list
-        if labels is None:
-            labels = []
-
-        # Ensure data is always a dict
-        if data is None:
-            data = {}
-
-        self._queue_item('event', {
-            'name': name,
-            'category': category,
-            'group': group,
-            'labels': labels,
-            'message': message,
-            'data': data,
-            'stacktrace': stacktrace
-        })
+        # One tuple allocation on the caller's thread; defaulting of
+        # labels/data and dict building happen on the sender thread
+        self._queue_item('event', (name, category, group, labels, message, data, stacktrace))
 
     def log_metric(self, name, value, tags=None, metric_type="gauge", count=None, unit=None, metadata=None, delta=None):
         """
@@ -927,22 +1702,7 @@ class AsyncSession(object):
             metadata (dict): Optional metadata
             delta (float): Optional delta for counters
         """
-        metric_data = {
-            'name': name,
-            'type': metric_type,
-            'value': value,
-            'tags': tags
-        }
-        if count is not None:
-            metric_data['count'] = count
-        if unit:
-            metric_data['unit'] = unit
-        if metadata:
-            metric_data['metadata'] = metadata
-        if delta is not None:
-            metric_data['delta'] = delta
-
-        self._queue_item('metric', metric_data)
+        self._queue_item('metric', (name, value, tags, metric_type, count, unit, metadata, delta))
 
     def log_gauge(self, name, value, unit=None, tags=None, metadata=None):
         """Log a gauge metric (non-blocking)"""
@@ -971,20 +1731,25 @@ class AsyncSession(object):
         Args:
             state (dict): State data to update
         """
-        self._queue_item('state', {'state': state})
+        self._queue_item('state', state)
 
     def log_exception(self, exc_info=None, extra_data=None):
         """
         Log an exception (non-blocking, returns immediately)
 
+        The traceback is formatted here, on the calling thread: exc_info
+        must be resolved while the exception context still exists, and
+        queueing raw traceback objects would pin every frame (and its
+        locals) until the sender drains the item.
+
         Args:
             exc_info (tuple): Exception info from sys.exc_info()
             extra_data (dict): Optional additional data
         """
-        self._queue_item('exception', {
-            'exc_info': exc_info,
-            'extra_data': extra_data
-        })
+        if exc_info is None:
+            exc_info = sys.exc_info()
+        described = _describe_exception(exc_info, self._tb_cache)
+        self._queue_item('exception', (described, extra_data))
 
     def heartbeat(self):
         """Send heartbeat (non-blocking, returns immediately)"""
@@ -993,82 +1758,141 @@ class AsyncSession(object):
 
     def _queue_item(self, item_type, data):
         """Internal method to queue an item for async processing"""
+        if not self.enabled:
+            return
         try:
             if self.drop_on_full:
-                self.queue.put_nowait({'type': item_type, 'data': data})
+                self.queue.put_nowait((item_type, data))
             else:
-                self.queue.put({'type': item_type, 'data': data})
+                self.queue.put((item_type, data))
         except queue.Full:
             self.dropped_count += 1
+            return
+        if self._drained.is_set():
+            self._drained.clear()
 
     def _background_sender(self):
         """Background thread that processes queued items"""
+        # Bind the per-item lookups once; the loop then calls locals
+        # instead of re-resolving attributes for every record
+        queue_get = self.queue.get
+        queue_get_nowait = self.queue.get_nowait
+        queue_empty = self.queue.empty
+        process = self._process_item
+        drained_set = self._drained.set
+
         while self.running:
             try:
-                # Get item with small timeout for batching
-                item = self.queue.get(timeout=0.01)
-
-                # Process based on type
-                item_type = item['type']
-                data = item['data']
+                # Producers wake us through the queue's ready event, so
+                # the timeout is only a health check on the running flag
+                # - one wakeup per second when idle, not a hundred
+                item = queue_get(timeout=1.0)
+            except queue.Empty:
+                continue
 
+            # Drain whatever else has already accumulated so one wakeup
+            # handles a whole burst instead of paying one loop iteration
+            # (and one timed wait) per item. Capped so a sustained flood
+            # can't starve the running-flag check.
+            batch = [item]
+            while len(batch) < 256:
                 try:
-                    if item_type == 'event':
-                        # Support backward compatibility: map 'level' to 'category'
-                        category = data.get('category')
-                        if category is None and 'level' in data:
-                            category = data.get('level')
-
-                        self.session.log_event(
-                            data['name'],
-                            category=category,
-                            group=data.get('group'),
-                            labels=data.get('labels'),
-                            message=data.get('message'),
-                            data=data.get('data'),
-                            stacktrace=data.get('stacktrace')
-                        )
-                    elif item_type == 'metric':
-                        self.session.log_metric(
-                            data['name'],
-                            data['value'],
-                            tags=data.get('tags'),
-                            metric_type=data.get('type', 'gauge'),
-                            count=data.get('count'),
-                            unit=data.get('unit'),
-                            metadata=data.get('metadata'),
-                            delta=data.get('delta')
-                        )
-                    elif item_type == 'state':
-                        self.session.update_state(data['state'])
-                    elif item_type == 'exception':
-                        self.session.log_exception(
-                            exc_info=data.get('exc_info'),
-                            extra_data=data.get('extra_data')
-                        )
-
-                    self.sent_count += 1
-
-                except Exception as e:
-                    # Don't crash background thread on logging errors
-                    import traceback
-                    print("AsyncSession error: {0}".format(str(e)))
-                    print("Traceback:")
-                    traceback.print_exc()
+                    batch.append(queue_get_nowait())
+                except queue.Empty:
+                    break
 
-            except queue.Empty:
-                continue
+            for item in batch:
+                process(item)
+
+            # Wake anyone blocked in flush() once we've caught up; a put
+            # racing this re-clears the event, and flush re-checks the
+            # queue after every wakeup anyway
+            if queue_empty():
+                drained_set()
+
+    def _process_item(self, item):
+        """Dispatch one queued item to the underlying session"""
+        item_type, data = item
+
+        try:
+            if item_type == 'event':
+                name, category, group, labels, message, event_data, stacktrace = data
+                self.session.log_event(
+                    name,
+                    category=category,
+                    group=group,
+                    labels=[] if labels is None else labels,
+                    message=message,
+                    data={} if event_data is None else event_data,
+                    stacktrace=stacktrace
+                )
+            elif item_type == 'metric':
+                name, value, tags, metric_type, count, unit, metadata, delta = data
+                self.session.log_metric(
+                    name,
+                    value,
+                    tags=tags,
+                    metric_type=metric_type,
+                    count=count,
+                    unit=unit,
+                    metadata=metadata,
+                    delta=delta
+                )
+            elif item_type == 'state':
+                self.session.update_state(data)
+            elif item_type == 'exception':
+                described, extra_data = data
+                (exception_type, exception_msg, stacktrace_lines,
+                 source_file, source_line, source_function) = described
+                # Already formatted on the producer side; send through
+                # the client so the exception-specific fields survive
+                # (Session.log_event doesn't forward them)
+                self.session.client.log_event(
+                    self.session.session_id,
+                    "exception",
+                    category="error",
+                    group="exception",
+                    labels=["exception", exception_type],
+                    message=exception_msg,
+                    data=extra_data if extra_data else {},
+                    stacktrace=stacktrace_lines,
+                    exception_type=exception_type,
+                    exception_msg=exception_msg,
+                    source_file=source_file,
+                    source_line=source_line,
+                    source_function=source_function,
+                )
+
+            self.sent_count += 1
+
+        except Exception as e:
+            # Don't crash the background thread on logging errors, and
+            # don't let an error storm (daemon down) stall the drain loop
+            # on stdout I/O per item: count every failure, report at most
+            # once a second
+            self.error_count += 1
+            now = _monotonic()
+            if now - self._last_error_log > 1.0:
+                self._last_error_log = now
+                # %-formatting: cheaper than str.format's __format__
+                # dispatch, and str(e) happens inside the interpolation
+                sys.stderr.write(
+                    "AsyncSession error (%d so far): %s\n"
+                    % (self.error_count, e)
+                )
+                traceback.print_exc()
 
     def get_stats(self):
         """
         Get logging statistics
 
         Returns:
-            dict: Statistics including sent, dropped, and queued counts
+            dict: Statistics including sent, dropped, error, and queued counts
         """
         return {
             'sent': self.sent_count,
             'dropped': self.dropped_count,
+            'errors': self.error_count,
             'queued': self.queue.qsize()
         }
 
@@ -1079,9 +1903,15 @@ class AsyncSession(object):
         Args:
             timeout (float): Maximum seconds to wait
         """
-        deadline = time.time() + timeout
-        while not self.queue.empty() and time.time() < deadline:
-            time.sleep(0.01)
+        deadline = _monotonic() + timeout
+        while not self.queue.empty():
+            remaining = deadline - _monotonic()
+            if remaining <= 0:
+                break
+            # Parked until the sender reports it has caught up - no
+            # 100 Hz polling; the loop re-checks in case a racing put
+            # slipped in between the sender's empty check and set()
+            self._drained.wait(remaining)
 
     def shutdown(self, timeout=2.0):
         """
@@ -1095,8 +1925,10 @@ class AsyncSession(object):
         # Flush remaining items
         self.flush(timeout)
 
-        # Stop background thread
+        # Stop background thread; wake it so it notices immediately
+        # rather than at its next health-check timeout
         self.running = False
+        self.queue.wake()
         if self.thread.is_alive():
             self.thread.join(timeout=1.0)
 
@@ -1127,10 +1959,75 @@ class AsyncSession(object):
         return self.session.client
 
 
+def _values_equal(old_value, new_value):
+    """
+    True only when old_value == new_value collapses to a truthy bool
+
+    Array-likes (numpy being the common case) return element-wise
+    results from ==, whose truth value raises. Anything that doesn't
+    reduce cleanly counts as changed: re-sending a value is safe,
+    raising inside a state diff is not.
+    """
+    try:
+        return bool(old_value == new_value)
+    except Exception:
+        return False
+
+
+def _deep_diff(old, new):
+    """
+    Return the sparse subset of new that differs from old
+
+    Dicts are compared recursively; None values (key deletions) are kept
+    only when the key actually exists in old.
+    """
+    delta = {}
+    for key, value in new.items():
+        if value is None:
+            if key in old:
+                delta[key] = None
+        elif isinstance(value, dict) and isinstance(old.get(key), dict):
+            sub = _deep_diff(old[key], value)
+            if sub:
+                delta[key] = sub
+        elif key not in old or not _values_equal(old[key], value):
+            delta[key] = value
+    return delta
+
+
+def _deep_merge(old, new):
+    """
+    Return old with new merged in, treating None values as deletions
+
+    Rather than mutating (or deep-copying) old, this path-copies: each
+    level touched by new gets a fresh dict, while subtrees new never
+    mentions are carried over by reference. Cost is proportional to the
+    changed leaves, not the total state size.
+    """
+    merged = dict(old)
+    for key, value in new.items():
+        if value is None:
+            merged.pop(key, None)
+        elif isinstance(value, dict) and isinstance(old.get(key), dict):
+            merged[key] = _deep_merge(old[key], value)
+        else:
+            # Copy container leaves so later caller-side mutation can't
+            # desynchronize the shadow from what was actually sent;
+            # numpy arrays are just as mutable as lists
+            if isinstance(value, (dict, list)) or (
+                _numpy is not None and isinstance(value, _numpy.ndarray)
+            ):
+                value = copy.deepcopy(value)
+            merged[key] = value
+    return merged
+
+
 # Convenience class for session management
 class Session(object):
     """Represents a datacat session with convenience methods"""
 
+    __slots__ = ('client', 'session_id', '_heartbeat_monitor', '_state_shadow')
+
     def __init__(self, client, session_id):
         """
         Initialize a session
@@ -1142,10 +2039,26 @@ class Session(object):
         self.client = client
         self.session_id = session_id
         self._heartbeat_monitor = None
+        self._state_shadow = {}
 
     def update_state(self, state):
-        """Update session state"""
-        return self.client.update_state(self.session_id, state)
+        """
+        Update session state
+
+        Keeps a client-side shadow of the session state and transmits only
+        the keys that actually changed; updates where nothing changed skip
+        the request entirely and return {"status": "unchanged"}.
+        """
+        delta = _deep_diff(self._state_shadow, state)
+        if not delta:
+            return {"status": "unchanged"}
+        result = self.client.update_state(self.session_id, delta)
+        # Merge only the delta, and only after the request succeeded:
+        # unchanged subtrees are shared with the previous shadow, and a
+        # failed send leaves the shadow untouched so retrying the same
+        # update still produces a delta instead of "unchanged"
+        self._state_shadow = _deep_merge(self._state_shadow, delta)
+        return result
 
     def log_event(
         self, name, category=None, group=None, labels=None, message=None, data=None, stacktrace=None, level=None
@@ -1310,6 +2223,9 @@ class Session(object):
         # Stop heartbeat monitor if running
         if self._heartbeat_monitor:
             self._heartbeat_monitor.stop()
+        # Note: the client is left usable - it may be shared by other
+        # sessions, and callers can still query this one. Releasing the
+        # pooled connections is an explicit client.close() lifecycle step.
         return self.client.end_session(self.session_id)
 
     def get_details(self):
@@ -1392,6 +2308,8 @@ class Timer(object):
     Supports counting iterations for average time calculations.
     """
 
+    __slots__ = ('session', 'name', 'count', 'tags', 'unit', 'start_time')
+
     def __init__(self, session, name, count=None, tags=None, unit="seconds"):
         """
         Initialize timer
@@ -1412,12 +2330,12 @@ class Timer(object):
 
     def __enter__(self):
         """Start timing"""
-        self.start_time = time.time()
+        self.start_time = _monotonic()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Stop timing and log metric"""
-        end_time = time.time()
+        end_time = _monotonic()
         duration = end_time - self.start_time
 
         # Convert to specified unit
@@ -17,6 +17,7 @@ from unittest.mock import Mock, patch, MagicMock
 # Add python directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
 
+import datacat
 from datacat import (
     DatacatClient,
     DaemonManager,
@@ -30,6 +31,27 @@ try:
 except ImportError:
     from urllib2 import HTTPError, URLError
 
+_saved_transports = None
+
+
+def setUpModule():
+    """Force the zero-dependency urllib transport for the whole module
+
+    These tests drive the client by patching datacat.urlopen. When
+    requests/urllib3 are installed the client would prefer its pooled
+    transport tiers, bypassing those patches (and int()-ing a mocked
+    daemon port), so disable the optional tiers up front and restore
+    them afterwards.
+    """
+    global _saved_transports
+    _saved_transports = (datacat._urllib3, datacat._requests)
+    datacat._urllib3 = None
+    datacat._requests = None
+
+
+def tearDownModule():
+    datacat._urllib3, datacat._requests = _saved_transports
+
 
 class TestDatacatClientErrorHandling(unittest.TestCase):
     """Test error handling in DatacatClient"""
@@ -617,55 +639,36 @@ class TestDaemonManager(unittest.TestCase):
         self.assertIsInstance(binary, str)
         self.assertTrue(len(binary) > 0)
 
-    @patch("datacat.subprocess.call")
-    def test_is_in_path_unix(self, mock_call):
-        """Test _is_in_path on Unix systems"""
-        manager = DaemonManager()
-
-        # Mock successful result (binary in PATH)
-        mock_call.return_value = 0
-        with patch("sys.platform", "linux"):
-            result = manager._is_in_path("test-binary")
-        self.assertTrue(result)
-
-        # Verify 'which' was called on Unix
-        mock_call.assert_called_with(
-            ["which", "test-binary"], stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-
-    @patch("datacat.subprocess.call")
-    def test_is_in_path_windows(self, mock_call):
-        """Test _is_in_path on Windows systems"""
+    @patch("datacat._shutil_which")
+    def test_is_in_path_found(self, mock_which):
+        """Test _is_in_path when binary is in PATH"""
         manager = DaemonManager()
 
-        # Mock successful result (binary in PATH)
-        mock_call.return_value = 0
-        with patch("sys.platform", "win32"):
-            result = manager._is_in_path("test-binary.exe")
+        # Mock successful lookup (binary in PATH)
+        mock_which.return_value = "/usr/local/bin/test-binary"
+        result = manager._is_in_path("test-binary")
         self.assertTrue(result)
 
-        # Verify 'where' was called on Windows
-        mock_call.assert_called_with(
-            ["where", "test-binary.exe"], stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
+        # Verify PATH was checked via shutil.which (no subprocess)
+        mock_which.assert_called_with("test-binary")
 
-    @patch("datacat.subprocess.call")
-    def test_is_in_path_not_found(self, mock_call):
+    @patch("datacat._shutil_which")
+    def test_is_in_path_not_found(self, mock_which):
         """Test _is_in_path when binary is not in PATH"""
         manager = DaemonManager()
 
-        # Mock unsuccessful result (binary not in PATH)
-        mock_call.return_value = 1
+        # Mock unsuccessful lookup (binary not in PATH)
+        mock_which.return_value = None
         result = manager._is_in_path("nonexistent-binary")
         self.assertFalse(result)
 
-    @patch("datacat.subprocess.call")
-    def test_is_in_path_exception_handling(self, mock_call):
+    @patch("datacat._shutil_which")
+    def test_is_in_path_exception_handling(self, mock_which):
         """Test _is_in_path handles exceptions gracefully"""
         manager = DaemonManager()
 
         # Mock exception
-        mock_call.side_effect = Exception("Command failed")
+        mock_which.side_effect = Exception("Lookup failed")
         result = manager._is_in_path("test-binary")
         self.assertFalse(result)
 
@@ -673,6 +676,7 @@ class TestDaemonManager(unittest.TestCase):
     def test_find_daemon_binary_checks_paths(self, mock_exists):
         """Test that _find_daemon_binary checks various paths"""
         manager = DaemonManager()
+        datacat._daemon_binary_cache.clear()
 
         # Mock that binary exists in second path
         def exists_side_effect(path):
@@ -690,6 +694,7 @@ class TestDaemonManager(unittest.TestCase):
     ):
         """Test that _find_daemon_binary returns default when not found anywhere"""
         manager = DaemonManager()
+        datacat._daemon_binary_cache.clear()
 
         # Mock that binary doesn't exist anywhere
         mock_exists.return_value = False
@@ -1046,6 +1051,13 @@ class TestHeartbeatMonitorWithDaemon(unittest.TestCase):
 
         monitor.heartbeat()
 
+        # Heartbeat sends are coalesced onto a background thread; wait
+        # for the sender to post before inspecting the request
+        for _ in range(100):
+            if mock_urlopen.called:
+                break
+            time.sleep(0.01)
+
         # Verify heartbeat was sent to daemon
         call_args = mock_urlopen.call_args
         request = call_args[0][0]
@@ -1090,6 +1102,44 @@ class TestSessionConvenienceMethods(unittest.TestCase):
         )
         self.assertEqual(result, {"status": "ok"})
 
+    def test_session_update_state_with_array_like_value(self):
+        """Test update_state tolerates element-wise equality semantics"""
+
+        class ElementwiseResult:
+            """Mimics numpy's refusal to collapse == results to bool"""
+
+            def __bool__(self):
+                raise ValueError(
+                    "The truth value of an array with more than one "
+                    "element is ambiguous"
+                )
+
+        class ArrayLike:
+            """Stand-in for numpy-style arrays with element-wise ==/!="""
+
+            def __init__(self, values):
+                self.values = list(values)
+
+            def __eq__(self, other):
+                return ElementwiseResult()
+
+            def __ne__(self, other):
+                return ElementwiseResult()
+
+        mock_client = Mock()
+        mock_client.update_state.return_value = {"status": "ok"}
+
+        session = Session(mock_client, "session-123")
+
+        # First update passes because the key is new; the second used to
+        # raise ValueError from the ambiguous truth value of the compare
+        session.update_state({"weights": ArrayLike([1, 2, 3])})
+        result = session.update_state({"weights": ArrayLike([1, 2, 3])})
+
+        # Ambiguous equality counts as changed, so both updates are sent
+        self.assertEqual(result, {"status": "ok"})
+        self.assertEqual(mock_client.update_state.call_count, 2)
+
     def test_session_log_event(self):
         """Test Session.log_event wrapper"""
         mock_client = Mock()